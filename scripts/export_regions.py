@@ -0,0 +1,97 @@
+"""
+Parallel Region Export Driver for Anatomy Explorer
+
+Each body region has its own Blender export script. The exports are
+independent, so this driver runs every region in a separate headless
+Blender process at the same time instead of one after another.
+
+Usage (plain Python, not inside Blender):
+    python scripts/export_regions.py path/to/z-anatomy.blend
+    python scripts/export_regions.py path/to/z-anatomy.blend --regions torso --output-dir public/models
+
+Requirements:
+- Blender on PATH, or pass --blender / set the BLENDER environment variable
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Export script for each region; add entries as new region scripts land
+REGION_SCRIPTS = {
+    "torso": "export_torso.py",
+}
+
+# ============================================================
+# EXPORT
+# ============================================================
+
+def run_region_export(blender: str, blend_file: str, region: str, output_dir: str) -> subprocess.CompletedProcess:
+    """Run one region's export script in a background Blender process."""
+    command = [
+        blender, blend_file,
+        "--background",
+        "--python-exit-code", "1",  # Fail the process if the script raises
+        "--python", os.path.join(SCRIPTS_DIR, REGION_SCRIPTS[region]),
+        "--", "--output-dir", output_dir,
+    ]
+    # Capture output so parallel exports don't interleave their logs
+    return subprocess.run(command, capture_output=True, text=True)
+
+
+def export_regions(blender: str, blend_file: str, regions: List[str], output_dir: str) -> Dict[str, int]:
+    """Export all regions concurrently. Returns each region's exit code."""
+    with ThreadPoolExecutor(max_workers=len(regions)) as pool:
+        futures = {
+            region: pool.submit(run_region_export, blender, blend_file, region, output_dir)
+            for region in regions
+        }
+        results = {region: future.result() for region, future in futures.items()}
+
+    for region, result in results.items():
+        print("=" * 60)
+        print(f"{region} (exit code {result.returncode})")
+        print("=" * 60)
+        print(result.stdout)
+        if result.returncode != 0:
+            print(result.stderr, file=sys.stderr)
+
+    return {region: result.returncode for region, result in results.items()}
+
+
+# ============================================================
+# MAIN EXECUTION
+# ============================================================
+
+def main():
+    """Parse arguments and run the region exports."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("blend_file", help="Z-Anatomy .blend file")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--regions", nargs="+", choices=sorted(REGION_SCRIPTS), default=sorted(REGION_SCRIPTS))
+    parser.add_argument(
+        "--output-dir",
+        default=os.path.join(SCRIPTS_DIR, "..", "public", "models"),
+        help="directory for the exported files",
+    )
+    args = parser.parse_args()
+
+    exit_codes = export_regions(args.blender, args.blend_file, args.regions, os.path.abspath(args.output_dir))
+    failed = [region for region, code in exit_codes.items() if code != 0]
+    if failed:
+        print(f"ERROR: export failed for: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+# Run if executed directly
+if __name__ == "__main__":
+    main()
@@ -10,28 +10,63 @@ Usage:
 3. Run the script
 4. Find the exported files in the specified output directory
 
+From the command line, arguments after "--" are passed to the script:
+    blender z-anatomy.blend --background --python export_torso.py -- --output-dir DIR
+
 Requirements:
 - Blender 3.0+ (tested with 3.6+)
 - Z-Anatomy Blender template installed
 """
 
+import argparse
 import bpy
+import functools
 import json
 import os
+import re
+import shutil
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
 from mathutils import Vector
-from typing import Dict, List, Set, Optional, Any
+from typing import Dict, FrozenSet, List, Set, Optional, Any, Tuple
+
+try:
+    # Optional: not bundled with Blender. Install into Blender's Python with
+    # `python -m pip install pyahocorasick` for faster name classification.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: faster JSON encoding, installed the same way as pyahocorasick
+    import orjson
+except ImportError:
+    orjson = None
 
 # ============================================================
 # CONFIGURATION
 # ============================================================
 
 # Output directory - change this to your project's public/models folder
+# (or pass --output-dir on the command line)
 OUTPUT_DIR = os.path.expanduser("~/anatomy-explorer/public/models")
 
 # Output filenames
 GLTF_FILENAME = "torso.glb"
 METADATA_FILENAME = "torso_metadata.json"
 
+# Set TORSO_FAST_EXPORT=1 for quicker iteration runs: materials are written as
+# placeholders, skipping material and texture encoding (the app assigns its
+# own materials). Leave unset for exports you intend to ship.
+FAST_EXPORT = bool(os.environ.get("TORSO_FAST_EXPORT"))
+
+# Set TORSO_GLTFPACK=1 to compress the exported .glb with gltfpack (meshopt
+# compression, multi-threaded, outside Blender) after Blender writes it.
+# Requires gltfpack on PATH: https://github.com/zeux/meshoptimizer
+COMPRESS_WITH_GLTFPACK = bool(os.environ.get("TORSO_GLTFPACK"))
+
 # Structure type mappings based on Z-Anatomy collection names
 # Z-Anatomy organizes by system, we need to map to our types
 COLLECTION_TYPE_MAP = {
@@ -115,73 +150,262 @@ EXCLUDE_PATTERNS = [
     "humerus",
 ]
 
+# Side indicators stripped from names (we'll handle bilateral structures later)
+SIDE_SUFFIXES = [".l", ".r", "_l", "_r", " left", " right", " (left)", " (right)"]
+
+# Name keywords used by the type/layer/region heuristics below
+BONE_KEYWORDS = ["bone", "vertebra", "rib", "sternum", "pelvis", "sacrum"]
+MUSCLE_KEYWORDS = ["muscle", "musculus", "abdominis", "dorsi", "pector"]
+DEEP_MUSCLE_KEYWORDS = ["transvers", "multifid", "rotat", "intercost", "diaphragm"]
+INTERMEDIATE_MUSCLE_KEYWORDS = ["oblique", "erector", "serratus", "internal"]
+
+REGION_KEYWORDS = {
+    "thorax": ["thorax", "thoracic", "rib", "sternum", "pector", "intercost"],
+    "abdomen": ["abdomen", "abdomin", "rectus", "oblique", "transvers"],
+    "pelvis": ["pelvis", "pelvic", "ilium", "iliac", "ischium", "pubis", "sacrum", "coccyx", "gluteus"],
+    "lumbar_spine": ["lumbar", "lumbo"],
+}
+
+# Structures that span several regions
+SPANNING_REGIONS = {
+    "erector": ["thorax", "abdomen"],
+    "latissimus": ["thorax", "abdomen"],
+    "psoas": ["abdomen", "pelvis"],
+}
+
+# Every keyword list above, keyed by the tag reported when a name contains
+# one of its words
+KEYWORD_GROUPS = {
+    "torso": TORSO_PATTERNS,
+    "exclude": EXCLUDE_PATTERNS,
+    "bone": BONE_KEYWORDS,
+    "muscle": MUSCLE_KEYWORDS,
+    "deep_muscle": DEEP_MUSCLE_KEYWORDS,
+    "intermediate_muscle": INTERMEDIATE_MUSCLE_KEYWORDS,
+    "thoracic": ["thoracic"],
+    "vertebra": ["vertebra"],
+    **{f"region:{region}": words for region, words in REGION_KEYWORDS.items()},
+    **{f"span:{word}": [word] for word in SPANNING_REGIONS},
+}
+
+# ============================================================
+# COMPILED PATTERNS
+# ============================================================
+
+def compile_patterns(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile a list of substrings into one alternation regex."""
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+
+# COLLECTION_TYPE_MAP with lowercase keys, for matching lowercase collection
+# names, and one regex that tells whether any key occurs at all
+COLLECTION_TYPE_KEYS = [(key.lower(), struct_type) for key, struct_type in COLLECTION_TYPE_MAP.items()]
+COLLECTION_TYPE_RE = compile_patterns([key for key, _struct_type in COLLECTION_TYPE_KEYS])
+
+# Side indicators at the end of a lowercase name. Each suffix may appear once,
+# in reverse list order, matching the old strip-each-suffix-in-turn loop.
+SIDE_SUFFIX_RE = re.compile("".join(f"(?:{re.escape(suffix)})?" for suffix in reversed(SIDE_SUFFIXES)) + "$")
+
+# Separators that become underscores in mesh IDs, and runs of underscores
+MESH_ID_SEPARATORS = str.maketrans({" ": "_", "-": "_", ".": "_"})
+UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+def build_automaton(groups: Dict[str, List[str]]) -> "ahocorasick.Automaton":
+    """Build an Aho-Corasick automaton mapping each keyword to its group tags."""
+    tags_by_word: Dict[str, Set[str]] = {}
+    for tag, words in groups.items():
+        for word in words:
+            tags_by_word.setdefault(word, set()).add(tag)
+    
+    automaton = ahocorasick.Automaton()
+    for word, tags in tags_by_word.items():
+        automaton.add_word(word, frozenset(tags))
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick every keyword group is matched in one pass over the
+# name; otherwise each group is one regex search.
+if ahocorasick is not None:
+    KEYWORD_AUTOMATON = build_automaton(KEYWORD_GROUPS)
+else:
+    KEYWORD_RES = {tag: compile_patterns(words) for tag, words in KEYWORD_GROUPS.items()}
+
+
+def match_keyword_groups(name_lower: str) -> FrozenSet[str]:
+    """Return the KEYWORD_GROUPS tags whose keywords occur in a lowercase name."""
+    if ahocorasick is not None:
+        hits: Set[str] = set()
+        for _end, tags in KEYWORD_AUTOMATON.iter(name_lower):
+            hits |= tags
+        return frozenset(hits)
+    return frozenset(tag for tag, pattern in KEYWORD_RES.items() if pattern.search(name_lower))
+
 # ============================================================
 # HELPER FUNCTIONS
 # ============================================================
 
-def normalize_name(name: str) -> str:
-    """Convert Z-Anatomy object name to a clean mesh ID."""
-    # Remove common prefixes/suffixes
-    clean = name.lower()
+def name_stem(name: str) -> str:
+    """Lowercase a name and strip its side indicator, so left/right pairs match."""
+    return SIDE_SUFFIX_RE.sub("", name.lower(), count=1)
+
+
+def stem_to_mesh_id(stem: str) -> str:
+    """Convert a name stem (see name_stem) to a clean mesh ID."""
+    # Replace spaces and special chars with underscores, collapsing runs
+    clean = UNDERSCORE_RUN_RE.sub("_", stem.translate(MESH_ID_SEPARATORS))
     
-    # Remove side indicators for now (we'll handle bilateral structures later)
-    for suffix in [".l", ".r", "_l", "_r", " left", " right", " (left)", " (right)"]:
-        if clean.endswith(suffix):
-            clean = clean[:-len(suffix)]
+    # Strip leading/trailing underscores
+    return clean.strip("_")
+
+
+@dataclass(frozen=True)
+class NameClassification:
+    """What the name keyword heuristics say about one object name."""
+    is_torso: bool
+    excluded: bool
+    name_type: str  # Used when no collection maps to a type
+    muscle_layer: int  # Used when the structure is a muscle
+    regions: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=4096)
+def classify_name(stem: str) -> NameClassification:
+    """
+    Run every name heuristic from a single keyword scan of a name stem.
+    Cached, so bilateral structures and repeated stems are classified once.
+    """
+    tags = match_keyword_groups(stem)
+    
+    # Type guess from name keywords alone
+    if "bone" in tags:
+        name_type = "bone"
+    elif "muscle" in tags:
+        name_type = "muscle"
+    else:
+        name_type = "muscle"  # Default fallback
+    
+    # Muscle layer: deep, intermediate, otherwise superficial
+    if "deep_muscle" in tags:
+        muscle_layer = 1
+    elif "intermediate_muscle" in tags:
+        muscle_layer = 2
+    else:
+        muscle_layer = 3
     
-    # Replace spaces and special chars with underscores
-    clean = clean.replace(" ", "_").replace("-", "_").replace(".", "_")
+    # Check for region indicators in name
+    regions = set()
+    for region in REGION_KEYWORDS:
+        if f"region:{region}" in tags:
+            regions.add(region)
+    if "thoracic" in tags and "vertebra" in tags:
+        regions.add("thoracic_spine")
     
-    # Remove double underscores
-    while "__" in clean:
-        clean = clean.replace("__", "_")
+    # Structures that span regions
+    for word, spanned in SPANNING_REGIONS.items():
+        if f"span:{word}" in tags:
+            regions.update(spanned)
     
-    # Strip leading/trailing underscores
-    clean = clean.strip("_")
+    # Default to torso if nothing specific found
+    if not regions:
+        regions.add("torso")
     
-    return clean
+    return NameClassification(
+        is_torso="torso" in tags,
+        excluded="exclude" in tags,
+        name_type=name_type,
+        muscle_layer=muscle_layer,
+        regions=tuple(regions),
+    )
 
 
-def matches_pattern(name: str, patterns: List[str]) -> bool:
-    """Check if a name matches any of the given patterns."""
-    name_lower = name.lower()
-    return any(pattern in name_lower for pattern in patterns)
+def build_collection_parent_map() -> Dict[str, bpy.types.Collection]:
+    """Map each collection name to the collection that contains it."""
+    collection_parents = {}
+    for parent_col in bpy.data.collections:
+        for child in parent_col.children:
+            # Keep the first parent found if a collection is linked twice
+            collection_parents.setdefault(child.name, parent_col)
+    return collection_parents
 
 
-def get_structure_type(obj: bpy.types.Object) -> str:
-    """Determine the structure type based on object's collection hierarchy."""
-    # Walk up the collection hierarchy to find type indicators
-    for collection in obj.users_collection:
-        col_name = collection.name
-        for key, struct_type in COLLECTION_TYPE_MAP.items():
-            if key.lower() in col_name.lower():
-                return struct_type
-        
-        # Check parent collections
-        def check_parents(col):
-            for parent_col in bpy.data.collections:
-                if col.name in [c.name for c in parent_col.children]:
-                    for key, struct_type in COLLECTION_TYPE_MAP.items():
-                        if key.lower() in parent_col.name.lower():
-                            return struct_type
-                    return check_parents(parent_col)
-            return None
+def match_collection_type(col_name_lower: str) -> Optional[str]:
+    """Return the COLLECTION_TYPE_MAP type for a lowercase collection name, if any."""
+    # Most collections match no key: reject those with a single regex search
+    if COLLECTION_TYPE_RE.search(col_name_lower) is None:
+        return None
+    
+    # Otherwise keep COLLECTION_TYPE_MAP order as the priority between keys
+    for key, struct_type in COLLECTION_TYPE_KEYS:
+        if key in col_name_lower:
+            return struct_type
+    return None
+
+
+def build_object_collection_index() -> Dict[str, List[str]]:
+    """
+    Map each object name to the collections that directly contain it.
+    
+    Same order as obj.users_collection, minus the scene's master collection
+    (which never names a type or torso region). users_collection scans every
+    collection on each access; this walks the collections once.
+    """
+    object_collections: Dict[str, List[str]] = {}
+    for collection in bpy.data.collections:
+        for obj in collection.objects:
+            object_collections.setdefault(obj.name, []).append(collection.name)
+    return object_collections
+
+
+def build_collection_type_index() -> Dict[str, Optional[str]]:
+    """
+    Map each collection name to the structure type it implies: its own
+    COLLECTION_TYPE_MAP match, otherwise that of its nearest matching ancestor.
+    """
+    collection_parents = build_collection_parent_map()
+    collection_types: Dict[str, Optional[str]] = {}
+    
+    for collection in bpy.data.collections:
+        # Walk up until a collection matches, the root is reached, or we hit an
+        # ancestor resolved earlier; everything on the way shares that result
+        chain = []
+        name = collection.name
+        struct_type = None
+        while name is not None:
+            if name in collection_types:
+                struct_type = collection_types[name]
+                break
+            chain.append(name)
+            struct_type = match_collection_type(name.lower())
+            if struct_type:
+                break
+            parent_col = collection_parents.get(name)
+            name = parent_col.name if parent_col is not None else None
         
-        parent_type = check_parents(collection)
-        if parent_type:
-            return parent_type
+        for chain_name in chain:
+            collection_types[chain_name] = struct_type
     
-    # Default based on object name heuristics
-    name_lower = obj.name.lower()
-    if any(bone_word in name_lower for bone_word in ["bone", "vertebra", "rib", "sternum", "pelvis", "sacrum"]):
-        return "bone"
-    if any(muscle_word in name_lower for muscle_word in ["muscle", "musculus", "abdominis", "dorsi", "pector"]):
-        return "muscle"
+    return collection_types
+
+
+def get_structure_type(
+    collection_names: List[str],
+    collection_types: Dict[str, Optional[str]],
+    classification: NameClassification,
+) -> str:
+    """Determine the structure type based on object's collection hierarchy."""
+    # The first collection whose hierarchy implies a type wins
+    for col_name in collection_names:
+        struct_type = collection_types.get(col_name)
+        if struct_type:
+            return struct_type
     
-    return "muscle"  # Default fallback
+    # Default based on object name heuristics
+    return classification.name_type
 
 
-def estimate_layer(obj: bpy.types.Object, struct_type: str) -> int:
+def estimate_layer(classification: NameClassification, struct_type: str) -> int:
     """Estimate the anatomical layer based on type and position."""
     if struct_type == "bone":
         return 0
@@ -196,55 +420,18 @@ def estimate_layer(obj: bpy.types.Object, struct_type: str) -> int:
     elif struct_type == "fascia":
         return 4
     else:  # muscle
-        # Estimate based on Z position (front vs back) and name
-        name_lower = obj.name.lower()
-        
-        # Deep muscles
-        if any(deep in name_lower for deep in ["transvers", "multifid", "rotat", "intercost", "diaphragm"]):
-            return 1
-        # Intermediate
-        if any(mid in name_lower for mid in ["oblique", "erector", "serratus", "internal"]):
-            return 2
-        # Superficial
-        return 3
-
-
-def get_regions(obj: bpy.types.Object) -> List[str]:
-    """Determine which body regions this structure belongs to."""
-    regions = set()
-    name_lower = obj.name.lower()
-    
-    # Check for region indicators in name
-    if any(t in name_lower for t in ["thorax", "thoracic", "rib", "sternum", "pector", "intercost"]):
-        regions.add("thorax")
-    if any(a in name_lower for a in ["abdomen", "abdomin", "rectus", "oblique", "transvers"]):
-        regions.add("abdomen")
-    if any(p in name_lower for p in ["pelvis", "pelvic", "ilium", "iliac", "ischium", "pubis", "sacrum", "coccyx", "gluteus"]):
-        regions.add("pelvis")
-    if any(s in name_lower for s in ["lumbar", "lumbo"]) or ("vertebra" in name_lower and "lumbar" in name_lower):
-        regions.add("lumbar_spine")
-    if "thoracic" in name_lower and "vertebra" in name_lower:
-        regions.add("thoracic_spine")
-    
-    # Structures that span regions
-    if any(span in name_lower for span in ["erector", "latissimus", "psoas"]):
-        if "erector" in name_lower or "latissimus" in name_lower:
-            regions.update(["thorax", "abdomen"])
-        if "psoas" in name_lower:
-            regions.update(["abdomen", "pelvis"])
-    
-    # Default to torso if nothing specific found
-    if not regions:
-        regions.add("torso")
-    
-    return list(regions)
+        # Estimate based on name
+        return classification.muscle_layer
 
 
 def get_object_center(obj: bpy.types.Object) -> List[float]:
     """Get the world-space center of an object's bounding box."""
-    local_bbox = [Vector(corner) for corner in obj.bound_box]
-    world_bbox = [obj.matrix_world @ corner for corner in local_bbox]
-    center = sum(world_bbox, Vector()) / 8
+    # The local box is axis-aligned, so its center is the midpoint of the
+    # opposite min (0) and max (6) corners. matrix_world is affine, so
+    # transforming that point once matches averaging the transformed corners.
+    bound_box = obj.bound_box
+    local_center = (Vector(bound_box[0]) + Vector(bound_box[6])) / 2
+    center = obj.matrix_world @ local_center
     return [round(center.x, 4), round(center.y, 4), round(center.z, 4)]
 
 
@@ -252,35 +439,66 @@ def get_object_center(obj: bpy.types.Object) -> List[float]:
 # MAIN EXPORT FUNCTIONS
 # ============================================================
 
-def find_torso_objects() -> List[bpy.types.Object]:
-    """Find all mesh objects that belong to the torso region."""
+def find_torso_objects(object_collections: Dict[str, List[str]]) -> List[bpy.types.Object]:
+    """Find all mesh objects in the active view layer that belong to the torso region."""
     torso_objects = []
     
-    for obj in bpy.data.objects:
+    # Match collection names against the torso patterns once, not per object
+    torso_collection_names = {
+        collection.name for collection in bpy.data.collections
+        if "torso" in match_keyword_groups(collection.name.lower())
+    }
+    
+    # Only the view layer's objects: anything else (other scenes, excluded
+    # collections) can't be selected for export and isn't worth scanning
+    for obj in bpy.context.view_layer.objects:
         # Only process mesh objects
         if obj.type != 'MESH':
             continue
         
+        name = obj.name
+        classification = classify_name(name_stem(name))
+        
         # Skip if it matches exclude patterns
-        if matches_pattern(obj.name, EXCLUDE_PATTERNS):
+        if classification.excluded:
             continue
         
-        # Include if it matches torso patterns
-        if matches_pattern(obj.name, TORSO_PATTERNS):
+        # Include if it matches torso patterns, or failing that, if any of
+        # its collection names do (short-circuits on the first hit)
+        if classification.is_torso or any(
+            col_name in torso_collection_names for col_name in object_collections.get(name, ())
+        ):
             torso_objects.append(obj)
-            continue
-        
-        # Also check collection names
-        for collection in obj.users_collection:
-            if matches_pattern(collection.name, TORSO_PATTERNS):
-                if not matches_pattern(obj.name, EXCLUDE_PATTERNS):
-                    torso_objects.append(obj)
-                break
     
     return torso_objects
 
 
-def prepare_export_objects(objects: List[bpy.types.Object]) -> Dict[str, Any]:
+def assign_mesh_ids(base_ids: List[str]) -> List[str]:
+    """Make mesh IDs unique by appending _1, _2, ... to repeated base IDs."""
+    # Track mesh IDs to handle duplicates, and the next counter to try for
+    # each base ID so repeated names don't re-probe taken suffixes
+    used_ids = set()
+    next_suffix = Counter()
+    mesh_ids = []
+    
+    for base_id in base_ids:
+        counter = next_suffix[base_id]
+        mesh_id = f"{base_id}_{counter}" if counter else base_id
+        # Only loops when another base ID already produced this suffixed name
+        while mesh_id in used_ids:
+            counter += 1
+            mesh_id = f"{base_id}_{counter}"
+        next_suffix[base_id] = counter + 1
+        used_ids.add(mesh_id)
+        mesh_ids.append(mesh_id)
+    
+    return mesh_ids
+
+
+def prepare_export_objects(
+    objects: List[bpy.types.Object],
+    object_collections: Dict[str, List[str]],
+) -> Dict[str, Any]:
     """
     Prepare objects for export and generate metadata.
     Returns a dictionary with metadata for each structure.
@@ -292,41 +510,42 @@ def prepare_export_objects(objects: List[bpy.types.Object]) -> Dict[str, Any]:
         "structures": {}
     }
     
-    # Track mesh IDs to handle duplicates
-    used_ids = set()
-    
-    for obj in objects:
-        # Generate clean mesh ID
-        base_id = normalize_name(obj.name)
-        mesh_id = base_id
-        counter = 1
-        while mesh_id in used_ids:
-            mesh_id = f"{base_id}_{counter}"
-            counter += 1
-        used_ids.add(mesh_id)
-        
-        # Rename object for export (so glTF uses our IDs)
-        original_name = obj.name
-        obj.name = mesh_id
-        
-        # Gather metadata
-        struct_type = get_structure_type(obj)
+    # Resolve every collection's type once instead of walking the
+    # hierarchy per object
+    collection_types = build_collection_type_index()
+    
+    # Lowercase and strip each name once; the mesh IDs and the name
+    # classification both start from the stem
+    original_names = [obj.name for obj in objects]
+    stems = [name_stem(name) for name in original_names]
+    mesh_ids = assign_mesh_ids([stem_to_mesh_id(stem) for stem in stems])
+    
+    for obj, original_name, stem, mesh_id in zip(objects, original_names, stems, mesh_ids):
+        # Gather metadata (before renaming, so this reuses the classification
+        # cached by find_torso_objects)
+        classification = classify_name(stem)
+        struct_type = get_structure_type(object_collections.get(original_name, []), collection_types, classification)
         metadata["structures"][mesh_id] = {
             "meshId": mesh_id,
             "originalName": original_name,
             "type": struct_type,
-            "layer": estimate_layer(obj, struct_type),
-            "regions": get_regions(obj),
+            "layer": estimate_layer(classification, struct_type),
+            "regions": list(classification.regions),
             "center": get_object_center(obj),
         }
+        
+        # Rename object for export (so glTF uses our IDs)
+        obj.name = mesh_id
     
     return metadata
 
 
 def export_gltf(objects: List[bpy.types.Object], output_path: str):
     """Export selected objects as a glTF file."""
-    # Deselect all
-    bpy.ops.object.select_all(action='DESELECT')
+    # Deselect all. Only touch what is selected rather than running the
+    # select_all operator, which visits every object in the view layer
+    for obj in bpy.context.selected_objects:
+        obj.select_set(False)
     
     # Select our objects
     for obj in objects:
@@ -344,7 +563,7 @@ def export_gltf(objects: List[bpy.types.Object], output_path: str):
         export_apply=True,  # Apply modifiers
         export_texcoords=True,
         export_normals=True,
-        export_materials='EXPORT',
+        export_materials='PLACEHOLDER' if FAST_EXPORT else 'EXPORT',
         export_colors=True,
         export_yup=True,  # Y-up for Three.js
     )
@@ -352,10 +571,30 @@ def export_gltf(objects: List[bpy.types.Object], output_path: str):
     print(f"Exported glTF to: {output_path}")
 
 
+def compress_gltf(path: str):
+    """Compress a .glb in place with gltfpack."""
+    gltfpack = shutil.which("gltfpack")
+    if gltfpack is None:
+        print("WARNING: gltfpack not found on PATH, leaving the glTF uncompressed")
+        return
+    
+    compressed_path = path[:-len(".glb")] + ".packed.glb"
+    # -cc: meshopt compression; -kn: keep named nodes so mesh IDs survive
+    subprocess.run([gltfpack, "-i", path, "-o", compressed_path, "-cc", "-kn"], check=True)
+    os.replace(compressed_path, path)
+    
+    print(f"Compressed glTF with gltfpack: {path}")
+
+
 def export_metadata(metadata: Dict, output_path: str):
     """Export metadata as JSON."""
-    with open(output_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        # Encode up front and write once: json.dump issues a write per token
+        with open(output_path, 'w') as f:
+            f.write(json.dumps(metadata, indent=2))
     
     print(f"Exported metadata to: {output_path}")
 
@@ -364,18 +603,30 @@ def export_metadata(metadata: Dict, output_path: str):
 # MAIN EXECUTION
 # ============================================================
 
+def parse_args() -> argparse.Namespace:
+    """Parse the script's own arguments (those after "--" on Blender's command line)."""
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="export_torso.py")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="directory for the .glb and metadata files")
+    return parser.parse_args(argv)
+
+
 def main():
     """Main export function."""
+    args = parse_args()
+    output_dir = args.output_dir
+    
     print("\n" + "=" * 60)
     print("Z-Anatomy Torso Export Script")
     print("=" * 60 + "\n")
     
     # Ensure output directory exists
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
     # Find torso objects
     print("Scanning for torso structures...")
-    torso_objects = find_torso_objects()
+    object_collections = build_object_collection_index()
+    torso_objects = find_torso_objects(object_collections)
     print(f"Found {len(torso_objects)} torso structures\n")
     
     if not torso_objects:
@@ -383,23 +634,24 @@ def main():
         print("Make sure you have Z-Anatomy loaded in Blender.")
         return
     
-    # List what we found
-    print("Structures to export:")
-    for obj in sorted(torso_objects, key=lambda o: o.name):
-        print(f"  - {obj.name}")
-    print()
+    # List what we found, as one write: Blender's console is slow to print
+    # hundreds of separate lines
+    names = sorted(obj.name for obj in torso_objects)
+    print("Structures to export:\n" + "".join(f"  - {name}\n" for name in names))
     
     # Prepare objects and generate metadata
     print("Preparing export...")
-    metadata = prepare_export_objects(torso_objects)
+    metadata = prepare_export_objects(torso_objects, object_collections)
     
     # Export glTF
-    gltf_path = os.path.join(OUTPUT_DIR, GLTF_FILENAME)
+    gltf_path = os.path.join(output_dir, GLTF_FILENAME)
     print(f"Exporting glTF to {gltf_path}...")
     export_gltf(torso_objects, gltf_path)
+    if COMPRESS_WITH_GLTFPACK:
+        compress_gltf(gltf_path)
     
     # Export metadata
-    metadata_path = os.path.join(OUTPUT_DIR, METADATA_FILENAME)
+    metadata_path = os.path.join(output_dir, METADATA_FILENAME)
     print(f"Exporting metadata to {metadata_path}...")
     export_metadata(metadata, metadata_path)
     